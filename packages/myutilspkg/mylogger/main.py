@@ -7,15 +7,254 @@ Utilities to simplify initializing logging for applications or modules.
 Provides:
 - `get_log_dir(dir_path=None)`: Return the absolute path to the directory used for storing logs. If not provided, a `log` subdirectory next to this module will be created.
 - `get_log_file(file_name=None)`: Determine the log filename. If not provided, returns `<name>.log` based on the module or script name.
-- `init_logger(module_name=None, dir_path=None, backup_count: int = 5)`: Initialize the root logger with a rotating file handler and a console handler and return a `logging.Logger`. Use `backup_count` to control how many rotated backups are kept (default: 5). Logs are written using UTF-8 encoding.
+- `FastFormatter`: `logging.Formatter` subclass that renders the fixed log line with an f-string and caches the timestamp per second.
+- `CountingRotatingFileHandler`: `RotatingFileHandler` that tracks the file size in memory instead of querying the stream on every record, and writes through a `FILE_BUFFER_SIZE` (64 KiB) buffer.
+- `BatchingQueueListener`: `QueueListener` that flushes its handlers once the queue is drained (or every `FLUSH_INTERVAL` seconds under load) rather than after every record.
+- `MemoizingLogger`: Wrapper around a `logging.Logger` that resolves the caller from the calling frame instead of `findCaller`'s stack walk.
+- `init_logger(module_name=None, dir_path=None, backup_count: int = 5, level: int = logging.INFO)`: Initialize the root logger with a queue handler whose background listener feeds a rotating file handler and a console handler, and return it wrapped in a `MemoizingLogger`. Use `backup_count` to control how many rotated backups are kept (default: 5) and `level` to set the logging level (default: INFO). Logs are written using UTF-8 encoding.
 
 Notes:
-- Calling `init_logger` multiple times in the same process will add duplicate handlers and can produce duplicate log output.
+- Calling `init_logger` multiple times for the same log file is safe: handlers already attached to the root logger are detected and reused, so log output is not duplicated.
 """
 from pathlib import Path
+import atexit
+import io
 import logging
 import logging.handlers
 import os
+import queue
+import sys
+import threading
+import time
+import traceback
+
+DEFAULT_DATEFMT = "%Y-%m-%d %H:%M:%S"
+
+# Resolved once at import: default base directory and file stem of this module
+_DEFAULT_BASE = Path(__file__).resolve().parent
+_THIS_MODULE_STEM = Path(__file__).stem
+
+# Log file write buffer, and how long buffered records may wait under load
+FILE_BUFFER_SIZE = 64 * 1024
+FLUSH_INTERVAL = 0.2
+
+# Serializes init_logger so concurrent callers don't attach duplicate handlers
+_init_lock = threading.Lock()
+
+
+class FastFormatter(logging.Formatter):
+    """Formatter producing ``asctime.msecs, levelname, name, funcName, message``.
+
+    ``logging.Formatter.format`` goes through the generic ``%``-style path and
+    calls ``time.localtime``/``time.strftime`` for every record. This formatter
+    builds the fixed line with an f-string and keeps the last second-resolution
+    timestamp, so ``strftime`` only runs when ``int(record.created)`` changes;
+    the milliseconds are appended with integer formatting. As with
+    ``logging.Formatter``, ``datefmt=None`` selects the default format
+    (``DEFAULT_DATEFMT``).
+    """
+
+    def __init__(self, datefmt=DEFAULT_DATEFMT):
+        super().__init__(datefmt=DEFAULT_DATEFMT if datefmt is None else datefmt)
+        self._uses_time = True
+        # (second, formatted second) for the most recent record
+        self._last_sec = (-1, '')
+
+    def usesTime(self):
+        return self._uses_time
+
+    def formatTime(self, record, datefmt=None):
+        if datefmt is not None and datefmt != self.datefmt:
+            return time.strftime(datefmt, time.localtime(record.created))
+        sec = int(record.created)
+        last_sec, last_sec_str = self._last_sec
+        if sec != last_sec:
+            last_sec_str = time.strftime(self.datefmt, time.localtime(sec))
+            self._last_sec = (sec, last_sec_str)
+        return last_sec_str
+
+    def format(self, record):
+        record.message = record.getMessage()
+        if 'asctime' not in record.__dict__:
+            record.asctime = self.formatTime(record)
+        s = (
+            f"{record.asctime}.{int(record.msecs):03d}, {record.levelname}, "
+            f"{record.name}, {record.funcName}, {record.message}"
+        )
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            s = f"{s}\n{record.exc_text}"
+        if record.stack_info:
+            s = f"{s}\n{self.formatStack(record.stack_info)}"
+        return s
+
+
+class CountingRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating file handler that keeps a running byte count of the log file.
+
+    ``RotatingFileHandler.shouldRollover`` formats the record, seeks and calls
+    ``tell()`` (and stats the file) for every record. This handler formats each
+    record once in ``emit``, adds its encoded size to a counter initialised from
+    the file size, and only touches the file system when a rollover is due.
+    The stream is in text mode, so each ``\\n`` is counted as the line
+    separator it is written as (``\\r\\n`` on Windows).
+
+    The stream is opened with a ``FILE_BUFFER_SIZE`` buffer. With
+    ``autoflush=False`` records are left in that buffer instead of being
+    flushed one by one, except for records at ``flush_level`` or above; the
+    owner is then responsible for calling ``flush()`` regularly (see
+    `BatchingQueueListener`). Rollover and ``close()`` flush as usual.
+    """
+
+    def __init__(self, *args, autoflush=True, flush_level=logging.WARNING, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.autoflush = autoflush
+        self.flush_level = flush_level
+        try:
+            self._bytes = os.path.getsize(self.baseFilename)
+        except OSError:
+            self._bytes = 0
+
+    def _open(self):
+        return self._builtin_open(
+            self.baseFilename, self.mode, buffering=FILE_BUFFER_SIZE,
+            encoding=self.encoding, errors=self.errors,
+        )
+
+    def shouldRollover(self, record):
+        return self.maxBytes > 0 and self._bytes >= self.maxBytes
+
+    def doRollover(self):
+        super().doRollover()
+        self._bytes = 0
+
+    def emit(self, record):
+        try:
+            msg = self.format(record) + self.terminator
+            # Count the bytes as written: text mode translates newlines
+            data = msg if os.linesep == '\n' else msg.replace('\n', os.linesep)
+            size = len(data.encode(self.encoding or 'utf-8', self.errors or 'strict'))
+            if self.maxBytes > 0 and self._bytes and self._bytes + size >= self.maxBytes:
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(msg)
+            if self.autoflush or record.levelno >= self.flush_level:
+                self.flush()
+            self._bytes += size
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class BatchingQueueListener(logging.handlers.QueueListener):
+    """QueueListener that flushes its handlers when the queue runs dry.
+
+    Paired with handlers that do not flush per record, a burst of records is
+    written with as few ``write()`` calls as the stream buffer allows, while
+    everything is still on disk as soon as the listener has caught up. Under
+    sustained load the handlers are also flushed every ``FLUSH_INTERVAL``
+    seconds.
+    """
+
+    def __init__(self, queue, *handlers, respect_handler_level=False):
+        super().__init__(queue, *handlers, respect_handler_level=respect_handler_level)
+        # Monotonic time by which the handlers are flushed even under load
+        self._next_flush = 0.0
+
+    def dequeue(self, block):
+        if block and (self.queue.empty() or time.monotonic() >= self._next_flush):
+            self._flush_handlers()
+        return self.queue.get(block)
+
+    def stop(self):
+        super().stop()
+        self._flush_handlers()
+
+    def _flush_handlers(self):
+        for handler in self.handlers:
+            handler.flush()
+        self._next_flush = time.monotonic() + FLUSH_INTERVAL
+
+
+class MemoizingLogger:
+    """Wrapper around a ``logging.Logger`` with a shorter logging call path.
+
+    ``Logger._log`` calls ``findCaller``, which walks the stack and normalizes
+    the file name of every frame to skip logging internals. This wrapper takes
+    the caller's frame directly with ``sys._getframe`` and builds the record
+    itself. Disabled levels return before any record or message work is done,
+    using the logger's own ``isEnabledFor`` cache, which is kept valid by
+    ``setLevel``. Any other attribute is delegated to the wrapped logger.
+    """
+
+    def __init__(self, logger):
+        self.logger = logger
+
+    def __getattr__(self, name):
+        return getattr(self.logger, name)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.logger!r}>"
+
+    def debug(self, msg, *args, **kwargs):
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self._log(logging.DEBUG, msg, args, **kwargs)
+
+    def info(self, msg, *args, **kwargs):
+        if self.logger.isEnabledFor(logging.INFO):
+            self._log(logging.INFO, msg, args, **kwargs)
+
+    def warning(self, msg, *args, **kwargs):
+        if self.logger.isEnabledFor(logging.WARNING):
+            self._log(logging.WARNING, msg, args, **kwargs)
+
+    def error(self, msg, *args, **kwargs):
+        if self.logger.isEnabledFor(logging.ERROR):
+            self._log(logging.ERROR, msg, args, **kwargs)
+
+    def exception(self, msg, *args, exc_info=True, **kwargs):
+        if self.logger.isEnabledFor(logging.ERROR):
+            self._log(logging.ERROR, msg, args, exc_info=exc_info, **kwargs)
+
+    def critical(self, msg, *args, **kwargs):
+        if self.logger.isEnabledFor(logging.CRITICAL):
+            self._log(logging.CRITICAL, msg, args, **kwargs)
+
+    def log(self, level, msg, *args, **kwargs):
+        if self.logger.isEnabledFor(level):
+            self._log(level, msg, args, **kwargs)
+
+    def _log(self, level, msg, args, exc_info=None, extra=None, stack_info=False, stacklevel=1):
+        # Frame 0 is _log, frame 1 the public method, frame 2 its caller
+        frame = sys._getframe(2)
+        while stacklevel > 1 and frame.f_back is not None:
+            frame = frame.f_back
+            stacklevel -= 1
+        code = frame.f_code
+
+        if exc_info:
+            if isinstance(exc_info, BaseException):
+                exc_info = (type(exc_info), exc_info, exc_info.__traceback__)
+            elif not isinstance(exc_info, tuple):
+                exc_info = sys.exc_info()
+
+        sinfo = None
+        if stack_info:
+            sio = io.StringIO()
+            sio.write('Stack (most recent call last):\n')
+            traceback.print_stack(frame, file=sio)
+            sinfo = sio.getvalue().rstrip('\n')
+
+        logger = self.logger
+        record = logger.makeRecord(
+            logger.name, level, code.co_filename, frame.f_lineno,
+            msg, args, exc_info, code.co_name, extra, sinfo,
+        )
+        logger.handle(record)
+
 
 def get_log_dir(dir_path=None):
     """Return a directory path for storing logs.
@@ -31,13 +270,14 @@ def get_log_dir(dir_path=None):
     """
     if dir_path is None:
         # Use the directory where this module resides
-        base_dir = Path(__file__).resolve().parent
+        base_dir = _DEFAULT_BASE
     else:
         # Normalize provided path to an absolute path
         base_dir = Path(os.path.abspath(dir_path))
 
     log_dir = base_dir / 'log'
-    log_dir.mkdir(parents=True, exist_ok=True)
+    if not log_dir.is_dir():
+        log_dir.mkdir(parents=True, exist_ok=True)
     return str(log_dir)
 
 def get_log_file(file_name=None):
@@ -64,7 +304,7 @@ def get_log_file(file_name=None):
     """
     if file_name is None:
         if __name__ == '__main__':
-            module_name = os.path.splitext(os.path.basename(__file__))[0]
+            module_name = _THIS_MODULE_STEM
         else:
             module_name = __name__
     else:
@@ -72,9 +312,40 @@ def get_log_file(file_name=None):
 
     return f"{module_name}.log"
 
-def init_logger(module_name=None, dir_path=None, backup_count: int = 5): 
+def _find_handlers(handlers, log_file_path):
+    """Return ``(file_handler, console_handler)`` found in ``handlers``.
+
+    Handlers are matched on a ``(type name, baseFilename)`` fingerprint: a
+    ``CountingRotatingFileHandler`` writing to ``log_file_path`` and a plain
+    ``StreamHandler`` writing to ``sys.stderr``. Missing handlers are ``None``.
+    """
+    file_key = (CountingRotatingFileHandler.__name__, os.path.abspath(log_file_path))
+    console_key = (logging.StreamHandler.__name__, None)
+    fh = ch = None
+    for h in handlers:
+        key = (type(h).__name__, getattr(h, 'baseFilename', None))
+        if key == file_key:
+            fh = h
+        elif key == console_key and h.stream is sys.stderr:
+            ch = h
+    return fh, ch
+
+def _listener_handlers(logger):
+    """Yield the handlers owned by the queue listeners attached to ``logger``."""
+    for h in logger.handlers:
+        listener = getattr(h, 'listener', None)
+        if isinstance(h, logging.handlers.QueueHandler) and listener is not None:
+            yield from listener.handlers
+
+def init_logger(module_name=None, dir_path=None, backup_count: int = 5, level: int = logging.INFO):
     """Initialize logging and return a configured logger.
 
+    The root logger only gets a ``QueueHandler``, so logging calls merely put
+    the record on a queue. A ``QueueListener`` thread owns the rotating file
+    handler and the console handler and does the formatting and I/O; the file
+    is flushed whenever the queue is drained, and the listener is stopped (and
+    the queue flushed) at interpreter exit.
+
     Parameters
     ----------
     module_name : str | None
@@ -87,13 +358,18 @@ def init_logger(module_name=None, dir_path=None, backup_count: int = 5):
     backup_count : int
         Number of rotated backup files to keep (passed to the file handler).
         Defaults to 5.
+    level : int
+        Level applied to the root logger and both handlers. Defaults to
+        ``logging.INFO``; pass ``logging.DEBUG`` to also record debug messages.
+        Records below this level are dropped before their message is built.
 
     Returns
     -------
-    logging.Logger
-        The configured root logger (note: this function attaches handlers to the
-        root logger). Be careful to avoid calling this multiple times in the same
-        process to prevent duplicate handlers.
+    MemoizingLogger
+        The configured root logger, wrapped in a `MemoizingLogger` (note: this
+        function attaches handlers to the root logger). Calling this again for
+        the same log file reuses the handlers that are already attached instead
+        of adding duplicates, updating their level to ``level``.
     """
     # Determine log directory and file path
     log_dir = get_log_dir(dir_path)
@@ -102,37 +378,58 @@ def init_logger(module_name=None, dir_path=None, backup_count: int = 5):
 
     # Configure the root logger so that all module loggers propagate to it
     logger = logging.getLogger()
-    logger.setLevel(logging.DEBUG)
-
-    # File handler: rotating file with UTF-8 encoding
-    fh = logging.handlers.RotatingFileHandler(
-        log_file_path,
-        maxBytes=1024 * 1024,
-        backupCount=backup_count,
-        encoding="utf-8",
-    )
-    fh.setLevel(logging.DEBUG)
-
-    # Console handler (stderr) for immediate visibility
-    ch = logging.StreamHandler()
-    ch.setLevel(logging.DEBUG)
-
-    # Common formatter applied to both handlers
-    formatter = logging.Formatter(
-        '%(asctime)s.%(msecs)03d, %(levelname)s, %(name)s, %(funcName)s, %(message)s',
-        datefmt="%Y-%m-%d %H:%M:%S"
-    )
-    fh.setFormatter(formatter)
-    ch.setFormatter(formatter)
-
-    # Attach handlers to the root logger
-    logger.addHandler(fh)
-    logger.addHandler(ch)
-
-    return logger
+
+    with _init_lock:
+        logger.setLevel(level)
+
+        # Reuse the pipeline attached by a previous call for the same target
+        fh, ch = _find_handlers(_listener_handlers(logger), log_file_path)
+        if fh is not None:
+            fh.setLevel(level)
+            if ch is not None:
+                ch.setLevel(level)
+            return MemoizingLogger(logger)
+
+        # Common formatter applied to both handlers (runs on the listener thread)
+        formatter = FastFormatter(datefmt=DEFAULT_DATEFMT)
+
+        # File handler: rotating file with UTF-8 encoding
+        fh = CountingRotatingFileHandler(
+            log_file_path,
+            maxBytes=1024 * 1024,
+            backupCount=backup_count,
+            encoding="utf-8",
+            autoflush=False,
+        )
+        fh.setLevel(level)
+        fh.setFormatter(formatter)
+        handlers = [fh]
+
+        if ch is None:
+            # Console handler (stderr) for immediate visibility
+            ch = logging.StreamHandler()
+            ch.setLevel(level)
+            ch.setFormatter(formatter)
+            handlers.append(ch)
+        else:
+            # The console handler already owned by an earlier pipeline
+            ch.setLevel(level)
+
+        # Hand records to a background thread that owns the handlers
+        q = queue.SimpleQueue()
+        qh = logging.handlers.QueueHandler(q)
+        listener = BatchingQueueListener(q, *handlers, respect_handler_level=True)
+        qh.listener = listener
+        listener.start()
+        atexit.register(listener.stop)
+
+        # Attach only the queue handler to the root logger
+        logger.addHandler(qh)
+
+    return MemoizingLogger(logger)
 
 if __name__ == '__main__':
-    logger = init_logger()
+    logger = init_logger(level=logging.DEBUG)
     logger.debug('log level debug')
     logger.info('log level info')
     logger.warning('log level warning')
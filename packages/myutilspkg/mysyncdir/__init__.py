@@ -6,19 +6,31 @@ Simple utility for directory synchronization.
 
 Main features:
 - `sync_dir(src, dst, exclude_hidden=False, verbose=False)`:
-    - Performs incremental synchronization using `dirsync.sync`.
-    - Removes files in the target that are not present in the source (`purge=True`).
-    - Creates the target directory if it does not exist (`create=True`).
-    - If `exclude_hidden=True`, copies the source to a temporary directory excluding hidden files and directories, then synchronizes from that copy.
-    - The `verbose` argument is passed to `dirsync.sync` to control detailed output.
+    - Mirrors the tree with `robocopy /MIR` on Windows (unless `exclude_hidden=True`) or `rsync -a --delete` elsewhere when the tool is on PATH.
+    - Otherwise compares both trees with `os.scandir`, one directory per worker thread, and copies only files whose size or modification time differ from the target.
+    - Removes files in the target that are not present in the source.
+    - Like `rsync -a`, copies symlinks as symlinks (they are never followed, in the source or the target) and skips special files such as FIFOs and sockets.
+    - Creates the target directory if it does not exist.
+    - If `exclude_hidden=True`, hidden files and directories are skipped (and removed from the target).
+    - The `verbose` argument shows the tool's output, or logs copied and removed items at INFO.
+    - Logs a one-line summary (with the number of copied and removed items for the Python sync) at INFO.
 
 Helpers:
-- `_is_hidden(path: Path)`: Determine whether a file or directory is hidden using UNIX/Windows rules.
-- `_ignore_hidden(dirpath, names)`: `shutil.copytree` ignore callback that excludes hidden items.
+- `_is_hidden_entry_win(entry)`: Windows check whether an `os.DirEntry` is hidden (leading dot or hidden attribute), reusing the attributes already returned by `os.scandir`.
+- `_visible_entries(entries)`: Filter an `os.scandir` listing, excluding hidden items (bound at import to `_visible_entries_posix`, a name-only filter, or `_visible_entries_win`).
+- `_is_outdated(src_st, dst_st)`: Compare a source and target file by size and modification time.
+- `_copy_file(src_path, dst_path)`: Copy a file with its metadata, using `os.copy_file_range` on Linux.
+- `_load_cache(src_dir, dst_dir, exclude_hidden)` / `_save_cache(src_dir, dst_dir, exclude_hidden, listings)`: Read and write the directory listing cache (`.mysyncdir-cache.json` in the target).
+- `_list_source(src_dir, exclude_hidden, previous, current, rel)`: List a source directory, reusing the cached listing while its mtime is unchanged (and not too recent to trust).
+- `_diff_dir(src_dir, dst_dir, exclude_hidden, previous, current, rel)`: Return the `(action, name)` steps (delete, rmdir, mkdir, copy, symlink) that make one target directory mirror the source, and the subdirectories to compare next.
+- `_sync_tree(src_dir, dst_dir, exclude_hidden, verbose, workers=COPY_WORKERS, walk_workers=WALK_WORKERS)`: Apply those steps, comparing directories on one `ThreadPoolExecutor` and copying files on another.
+- `_native_sync_command(src, dst, exclude_hidden, verbose)`: Build the `robocopy`/`rsync` command line, or return None if the tool is unavailable.
+- `_sync_native(cmd, dst, verbose)`: Run that command and check its exit code.
 
 Notes:
-- Uses `ctypes` to check the Windows hidden attribute.
-- When run directly, initializes logging via `myutilspkg.mylogger.init_logger` and synchronizes to `mysyncdirdst` under the user's home directory.
+- On POSIX, directories are opened once and their entries are stat'ed, created and removed relative to the directory descriptor (`dir_fd`).
+- The module logger has no level of its own, so the application's logging configuration decides what is emitted.
+- When run directly, initializes logging via `myutilspkg.mylogger.init_logger` at DEBUG level and synchronizes to `mysyncdirdst` under the user's home directory.
 """
 from .main import sync_dir
 __all__ = ['sync_dir']
\ No newline at end of file
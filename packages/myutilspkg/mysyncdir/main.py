@@ -6,70 +6,510 @@ Simple utility for directory synchronization.
 
 Main features:
 - `sync_dir(src, dst, exclude_hidden=False, verbose=False)`:
-    - Performs incremental synchronization using `dirsync.sync`.
-    - Removes files in the target that are not present in the source (`purge=True`).
-    - Creates the target directory if it does not exist (`create=True`).
-    - If `exclude_hidden=True`, copies the source to a temporary directory excluding hidden files and directories, then synchronizes from that copy.
-    - The `verbose` argument is passed to `dirsync.sync` to control detailed output.
+    - Mirrors the tree with `robocopy /MIR` on Windows (unless `exclude_hidden=True`) or `rsync -a --delete` elsewhere when the tool is on PATH.
+    - Otherwise compares both trees with `os.scandir`, one directory per worker thread, and copies only files whose size or modification time differ from the target.
+    - Removes files in the target that are not present in the source.
+    - Like `rsync -a`, copies symlinks as symlinks (they are never followed, in the source or the target) and skips special files such as FIFOs and sockets.
+    - Creates the target directory if it does not exist.
+    - If `exclude_hidden=True`, hidden files and directories are skipped (and removed from the target).
+    - The `verbose` argument shows the tool's output, or logs copied and removed items at INFO.
+    - Logs a one-line summary (with the number of copied and removed items for the Python sync) at INFO.
 
 Helpers:
-- `_is_hidden(path: Path)`: Determine whether a file or directory is hidden using UNIX/Windows rules.
-- `_ignore_hidden(dirpath, names)`: `shutil.copytree` ignore callback that excludes hidden items.
+- `_is_hidden_entry_win(entry)`: Windows check whether an `os.DirEntry` is hidden (leading dot or hidden attribute), reusing the attributes already returned by `os.scandir`.
+- `_visible_entries(entries)`: Filter an `os.scandir` listing, excluding hidden items (bound at import to `_visible_entries_posix`, a name-only filter, or `_visible_entries_win`).
+- `_is_outdated(src_st, dst_st)`: Compare a source and target file by size and modification time.
+- `_copy_file(src_path, dst_path)`: Copy a file with its metadata, using `os.copy_file_range` on Linux.
+- `_load_cache(src_dir, dst_dir, exclude_hidden)` / `_save_cache(src_dir, dst_dir, exclude_hidden, listings)`: Read and write the directory listing cache (`.mysyncdir-cache.json` in the target).
+- `_list_source(src_dir, exclude_hidden, previous, current, rel)`: List a source directory, reusing the cached listing while its mtime is unchanged (and not too recent to trust).
+- `_diff_dir(src_dir, dst_dir, exclude_hidden, previous, current, rel)`: Return the `(action, name)` steps (delete, rmdir, mkdir, copy, symlink) that make one target directory mirror the source, and the subdirectories to compare next.
+- `_sync_tree(src_dir, dst_dir, exclude_hidden, verbose, workers=COPY_WORKERS, walk_workers=WALK_WORKERS)`: Apply those steps, comparing directories on one `ThreadPoolExecutor` and copying files on another.
+- `_native_sync_command(src, dst, exclude_hidden, verbose)`: Build the `robocopy`/`rsync` command line, or return None if the tool is unavailable.
+- `_sync_native(cmd, dst, verbose)`: Run that command and check its exit code.
 
 Notes:
-- Uses `ctypes` to check the Windows hidden attribute.
-- When run directly, initializes logging via `myutilspkg.mylogger.init_logger` and synchronizes to `mysyncdirdst` under the user's home directory.
+- On POSIX, directories are opened once and their entries are stat'ed, created and removed relative to the directory descriptor (`dir_fd`).
+- The module logger has no level of its own, so the application's logging configuration decides what is emitted.
+- When run directly, initializes logging via `myutilspkg.mylogger.init_logger` at DEBUG level and synchronizes to `mysyncdirdst` under the user's home directory.
 """
 
+import errno
+import json
 import logging
 import os
 import shutil
-import tempfile
-import ctypes
-from dirsync import sync
+import stat
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
 
-def _is_hidden(path: Path) -> bool:
+# Number of threads copying files in parallel in the Python sync.
+# Copies are I/O bound, so use several threads per CPU (capped like the
+# ThreadPoolExecutor default).
+COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Number of threads reading directory listings in parallel in the Python sync
+WALK_WORKERS = os.cpu_count() or 1
+
+# In-kernel file copies on Linux, and the errors that mean "use a plain copy"
+_USE_COPY_FILE_RANGE = hasattr(os, 'copy_file_range') and sys.platform.startswith('linux')
+_COPY_FILE_RANGE_CHUNK = 1 << 30
+_COPY_FILE_RANGE_FALLBACK_ERRNOS = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EPERM}
+
+# Directory listing cache kept in the target by the Python sync
+CACHE_FILE_NAME = '.mysyncdir-cache.json'
+CACHE_VERSION = 3
+# A listing is only reused when the directory mtime is older than the scan by
+# at least this much. Timestamps can be coarse (2 s on FAT/exFAT, clock ticks
+# or server-side granularity elsewhere), so a name added right after the scan
+# may leave the mtime unchanged; such "racy" listings are read again next time.
+CACHE_RACY_WINDOW_NS = 2 * 10**9
+
+FILE_ATTRIBUTE_HIDDEN = 0x2
+
+def _is_hidden_entry_win(entry) -> bool:
     """
-    Determine whether the given file or directory is hidden.
+    Windows: Hidden if the entry's name starts with a dot or its hidden file attribute is set.
 
-    UNIX: Hidden if the name starts with a dot.
-    Windows: Hidden if the name starts with a dot or the hidden file attribute is set.
+    The attributes are taken from `entry.stat(follow_symlinks=False)`, which
+    `os.scandir` already filled in from its FindFirstFileW/FindNextFileW
+    listing, so no per-entry GetFileAttributesW call is made.
     """
-    if path.name.startswith('.'):
+    if entry.name.startswith('.'):
         return True
-    if os.name == 'nt':
+    attrs = entry.stat(follow_symlinks=False).st_file_attributes
+    return bool(attrs & FILE_ATTRIBUTE_HIDDEN)
+
+def _visible_entries_posix(entries):
+    """
+    Return the `os.DirEntry` objects in `entries` that are not hidden (UNIX).
+
+    Only the entry name matters here, so the filter is a plain comprehension
+    over the names; no `Path` objects or per-entry helper calls are involved.
+    """
+    return [entry for entry in entries if not entry.name.startswith('.')]
+
+def _visible_entries_win(entries):
+    """
+    Return the `os.DirEntry` objects in `entries` that are not hidden (Windows).
+
+    The filter itself has no exception handling: the attributes come from the
+    `os.scandir` listing, so reading them does not touch the disk. Should that
+    fail anyway, the error is handled once for the whole listing, which is
+    then filtered by name only.
+    """
+    try:
+        return [entry for entry in entries if not _is_hidden_entry_win(entry)]
+    except OSError as e:
+        logger.debug('Error checking attributes: %s', e)
+        return [entry for entry in entries if not entry.name.startswith('.')]
+
+# Pick the platform implementation once instead of testing os.name per call.
+# _visible_entries(entries) drops the hidden items from a directory listing.
+if os.name == 'nt':
+    _visible_entries = _visible_entries_win
+else:
+    _visible_entries = _visible_entries_posix
+
+# On POSIX each directory is opened once and the entries in it are read,
+# stat'ed, created and removed relative to that descriptor (fstatat, mkdirat,
+# unlinkat), so the kernel resolves a single name per call instead of the
+# whole path. Windows uses full paths.
+_USE_DIR_FD = (
+    os.scandir in os.supports_fd
+    and {os.open, os.stat, os.mkdir, os.unlink, os.rmdir, os.readlink, os.symlink} <= os.supports_dir_fd
+)
+_DIR_OPEN_FLAGS = os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0)
+# Subdirectories are opened without following a symlink put in their place
+_SUBDIR_OPEN_FLAGS = _DIR_OPEN_FLAGS | getattr(os, 'O_NOFOLLOW', 0)
+
+def _is_outdated(src_st, dst_st) -> bool:
+    """
+    Return True if the target file (`dst_st`) differs in size or mtime from the source (`src_st`).
+    """
+    return src_st.st_size != dst_st.st_size or src_st.st_mtime_ns != dst_st.st_mtime_ns
+
+def _copy_file_range(src_path, dst_path, size):
+    """
+    Copy the data of `src_path` (a regular file of `size` bytes) to `dst_path` with `os.copy_file_range`.
+
+    Returns False when nothing was copied from a non-empty file: some
+    filesystems report success from `copy_file_range` without copying, so
+    the caller then copies the file another way.
+    """
+    with open(src_path, 'rb') as fsrc, open(dst_path, 'wb') as fdst:
+        in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+        copied = 0
+        # Returns 0 at end of file
+        while n := os.copy_file_range(in_fd, out_fd, _COPY_FILE_RANGE_CHUNK):
+            copied += n
+    return copied > 0 or size == 0
+
+def _copy_file(src_path, dst_path):
+    """
+    Copy a file and its metadata, like `shutil.copy2`.
+
+    On Linux the data of a regular file is copied with `os.copy_file_range`,
+    which stays inside the kernel and lets filesystems such as btrfs and XFS
+    share extents (reflink) instead of writing the bytes again. When it is
+    unavailable, refused (e.g. across filesystems on older kernels) or copies
+    nothing, `shutil.copyfile` is used; it already copies through
+    `os.sendfile` on Linux and `fcopyfile` on macOS. Special files are never
+    opened here: `shutil.copyfile` rejects them.
+
+    Raises:
+        shutil.SpecialFileError: If `src_path` is a FIFO or another special file.
+    """
+    copied = False
+    if _USE_COPY_FILE_RANGE:
+        st = os.stat(src_path)
+        if stat.S_ISREG(st.st_mode):
+            try:
+                copied = _copy_file_range(src_path, dst_path, st.st_size)
+            except OSError as e:
+                if e.errno not in _COPY_FILE_RANGE_FALLBACK_ERRNOS:
+                    raise
+    if not copied:
+        shutil.copyfile(src_path, dst_path)
+    shutil.copystat(src_path, dst_path)
+
+def _load_cache(src_dir, dst_dir, exclude_hidden):
+    """
+    Return the directory listings saved in `dst_dir` by the last sync of `src_dir`.
+
+    The result maps a relative directory path to `[mtime_ns, dirs, files, links]`.
+    An empty dict is returned when there is no cache, it cannot be read, it
+    has another `CACHE_VERSION` or it was written for a different source or
+    `exclude_hidden` setting.
+    """
+    try:
+        with open(os.path.join(dst_dir, CACHE_FILE_NAME), encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if (not isinstance(data, dict)
+            or data.get('version') != CACHE_VERSION
+            or data.get('src') != src_dir
+            or data.get('exclude_hidden') != exclude_hidden):
+        return {}
+    return data.get('dirs', {})
+
+def _save_cache(src_dir, dst_dir, exclude_hidden, listings):
+    """
+    Write the directory listings of this run to `dst_dir` (see `_load_cache`).
+    """
+    path = os.path.join(dst_dir, CACHE_FILE_NAME)
+    tmp_path = path + '.tmp'
+    data = {'version': CACHE_VERSION, 'src': src_dir, 'exclude_hidden': exclude_hidden, 'dirs': listings}
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+def _list_source(src_dir, exclude_hidden, previous, current, rel):
+    """
+    Return `(dirs, files, links, entries)` describing the source directory
+    `src_dir` (a path, or a file descriptor when `_USE_DIR_FD` is True).
+
+    Entries are classified without following symlinks, like `rsync -a`:
+    `dirs` are real directories, `files` regular files and `links` symbolic
+    links (recreated as links, never followed). Special files such as FIFOs,
+    sockets and devices are skipped with a warning.
+
+    The directory is read with `os.scandir` (without hidden items when
+    `exclude_hidden` is True) unless its modification time still matches the
+    listing recorded in `previous` for `rel`: the set of names in a directory
+    only changes when its mtime does, so that listing is reused and the
+    directory is not read at all. `entries` maps names to `os.DirEntry`
+    objects and is empty for a reused listing. The listing used is recorded
+    in `current`, unless the mtime is within `CACHE_RACY_WINDOW_NS` of the
+    time it was read: a change in the same timestamp tick would not be
+    visible, so that directory is read again on the next run.
+    """
+    # Stat before listing so that a concurrent change leaves a newer mtime behind
+    mtime_ns = os.stat(src_dir).st_mtime_ns
+    scanned_ns = time.time_ns()
+    listing = previous.get(rel)
+    if listing is not None and listing[0] == mtime_ns:
+        dirs, files, links = listing[1], listing[2], listing[3]
+        entries = {}
+    else:
+        with os.scandir(src_dir) as it:
+            scanned = list(it)
+        if exclude_hidden:
+            visible = _visible_entries(scanned)
+            if len(visible) != len(scanned):
+                logger.debug('Ignoring %d hidden item(s) in %s', len(scanned) - len(visible), rel or os.curdir)
+            scanned = visible
+        entries = {entry.name: entry for entry in scanned}
+        # Split the names in a single pass; the file type comes with the listing
+        dirs = []
+        files = []
+        links = []
+        for entry in scanned:
+            if entry.is_symlink():
+                links.append(entry.name)
+            elif entry.is_dir(follow_symlinks=False):
+                dirs.append(entry.name)
+            elif entry.is_file(follow_symlinks=False):
+                files.append(entry.name)
+            else:
+                logger.warning('Skipping special file %s in %s', entry.name, rel or os.curdir)
+    if mtime_ns < scanned_ns - CACHE_RACY_WINDOW_NS:
+        current[rel] = [mtime_ns, dirs, files, links]
+    return dirs, files, links, entries
+
+def _diff_dir(src_dir, dst_dir, exclude_hidden, previous, current, rel):
+    """
+    Return the steps that make directory `dst_dir` mirror `src_dir`, one level deep.
+
+    `src_dir` and `dst_dir` are paths, or directory file descriptors when
+    `_USE_DIR_FD` is True; `rel` is their path relative to the roots.
+    Returns `(steps, subdirs, links)`. `steps` is a list of `(action, name)`
+    pairs, where `action` is one of 'delete' (remove a file or symlink),
+    'rmdir' (remove a directory tree), 'mkdir', 'copy' or 'symlink' and
+    `name` is an entry of the directory. `subdirs` lists the names of the
+    source subdirectories, whose contents are compared by separate calls
+    once the steps of this level have been applied. `links` maps the name of
+    each symlink to create to the link's target.
+    Both sides are read with `os.scandir`, whose entries carry the file type
+    (and on Windows the size and mtime) so the target needs no separate stat
+    per file. A file is copied when it is missing from the target or its size
+    or mtime differs; a symlink is recreated unless the target already has a
+    symlink with the same link text. The steps can be applied in the order
+    listed: stale target items are removed before a name is reused and missing
+    subdirectories are created.
+    """
+    dirs, files, links, src_entries = _list_source(src_dir, exclude_hidden, previous, current, rel)
+    with os.scandir(dst_dir) as it:
+        dst_entries = {entry.name: entry for entry in it}
+
+    kept = set(dirs)
+    kept.update(files)
+    kept.update(links)
+    if not rel:
+        kept.add(CACHE_FILE_NAME)
+
+    # Target entries are classified without following symlinks: a symlink in
+    # the target is removed like a file, never descended into or written
+    # through, so nothing outside dst_dir is touched
+    steps = []
+    # Items that are missing (or hidden) in the source
+    for name, entry in dst_entries.items():
+        if name not in kept:
+            action = 'rmdir' if entry.is_dir(follow_symlinks=False) else 'delete'
+            steps.append((action, name))
+
+    for name in files:
+        dst_entry = dst_entries.get(name)
+        if dst_entry is not None and not dst_entry.is_file(follow_symlinks=False):
+            steps.append(('rmdir' if dst_entry.is_dir(follow_symlinks=False) else 'delete', name))
+            dst_entry = None
+        if dst_entry is None:
+            steps.append(('copy', name))
+            continue
+        src_entry = src_entries.get(name)
+        if src_entry is not None:
+            src_st = src_entry.stat()
+        elif _USE_DIR_FD:
+            src_st = os.stat(name, dir_fd=src_dir)
+        else:
+            src_st = os.stat(src_dir + os.sep + name)
+        if _is_outdated(src_st, dst_entry.stat(follow_symlinks=False)):
+            steps.append(('copy', name))
+
+    for name in dirs:
+        dst_entry = dst_entries.get(name)
+        if dst_entry is not None and not dst_entry.is_dir(follow_symlinks=False):
+            steps.append(('delete', name))
+            dst_entry = None
+        if dst_entry is None:
+            steps.append(('mkdir', name))
+
+    new_links = {}
+    for name in links:
+        if _USE_DIR_FD:
+            link_target = os.readlink(name, dir_fd=src_dir)
+        else:
+            link_target = os.readlink(src_dir + os.sep + name)
+        dst_entry = dst_entries.get(name)
+        if dst_entry is not None:
+            if dst_entry.is_symlink():
+                if _USE_DIR_FD:
+                    dst_target = os.readlink(name, dir_fd=dst_dir)
+                else:
+                    dst_target = os.readlink(dst_dir + os.sep + name)
+                if dst_target == link_target:
+                    continue
+            steps.append(('rmdir' if dst_entry.is_dir(follow_symlinks=False) else 'delete', name))
+        steps.append(('symlink', name))
+        new_links[name] = link_target
+    return steps, dirs, new_links
+
+def _sync_tree(src_dir, dst_dir, exclude_hidden, verbose, workers=COPY_WORKERS, walk_workers=WALK_WORKERS):
+    """
+    Make `dst_dir` mirror `src_dir` by applying the steps from `_diff_dir`.
+
+    The tree is traversed in parallel: each directory is compared on a walk
+    thread pool (`walk_workers` threads), which creates missing
+    subdirectories and removes stale target items in the order `_diff_dir`
+    lists them, and returns the subdirectories to compare next. `os.scandir`
+    and `os.stat` release the GIL, so the listings of sibling subtrees are
+    read concurrently. With `_USE_DIR_FD`, each source and target directory
+    is opened once for this and the work inside it is done relative to the
+    descriptor. File copies (`_copy_file`, metadata included so unchanged
+    files compare equal on the next run) are queued to a second pool of
+    `workers` threads as they are found, so they overlap with the rest of
+    the traversal. Returns once every copy has finished. As soon as a
+    directory or copy fails, queued work is cancelled and the error is
+    re-raised. The directory listings are loaded from and, after a
+    successful run, saved to `CACHE_FILE_NAME` in `dst_dir`. The cache is
+    not used on Windows with `exclude_hidden`, because setting or clearing
+    the hidden attribute does not change the parent directory's mtime.
+
+    Returns `(copied, removed)`, the number of files copied and of target
+    items removed.
+    """
+    use_cache = not (exclude_hidden and os.name == 'nt')
+    previous = _load_cache(src_dir, dst_dir, exclude_hidden) if use_cache else {}
+    current = {}
+    copies = []
+    removed = []
+
+    def sync_level(rel):
+        # Compare one directory and apply its steps; copies go to copy_pool
+        if rel:
+            src_path = src_dir + os.sep + rel
+            dst_path = dst_dir + os.sep + rel
+        else:
+            src_path, dst_path = src_dir, dst_dir
+        # Child paths are built by plain concatenation; the roots are
+        # normalized absolute paths, so os.path.join's checks are not needed
+        src_prefix = src_path + os.sep
+        dst_prefix = dst_path + os.sep
+        rel_prefix = rel + os.sep if rel else ''
+        if _USE_DIR_FD:
+            # The roots may be symlinks given by the caller; below them only
+            # real directories are descended into
+            flags = _SUBDIR_OPEN_FLAGS if rel else _DIR_OPEN_FLAGS
+            src_ref = os.open(src_path, flags)
+            try:
+                dst_ref = os.open(dst_path, flags)
+            except BaseException:
+                os.close(src_ref)
+                raise
+            # Target entries are created and removed relative to dst_ref
+            op_prefix, op_dir_fd = '', dst_ref
+        else:
+            src_ref, dst_ref = src_path, dst_path
+            op_prefix, op_dir_fd = dst_prefix, None
         try:
-            attrs = ctypes.windll.kernel32.GetFileAttributesW(str(path))
-            if attrs == -1:
-                return False
-            FILE_ATTRIBUTE_HIDDEN = 0x2
-            return bool(attrs & FILE_ATTRIBUTE_HIDDEN)
-        except Exception:
-            return False
-    return False
-
-def _ignore_hidden(dirpath, names):
-    """
-    `shutil.copytree` ignore callback that skips hidden files/directories.
-    """
-    ignore = set()
-    base = Path(dirpath)
-    for name in names:
+            steps, subdirs, links = _diff_dir(src_ref, dst_ref, exclude_hidden, previous, current, rel)
+            for action, name in steps:
+                if action == 'copy':
+                    source = src_prefix + name
+                    target = dst_prefix + name
+                    if verbose:
+                        logger.info('Copying %s to %s', source, target)
+                    copies.append(copy_pool.submit(_copy_file, source, target))
+                elif action == 'mkdir':
+                    os.mkdir(op_prefix + name, dir_fd=op_dir_fd)
+                elif action == 'symlink':
+                    if verbose:
+                        logger.info('Linking %s to %s', dst_prefix + name, links[name])
+                    # Windows needs to know whether the link points to a directory
+                    is_dir = os.name == 'nt' and os.path.isdir(src_prefix + name)
+                    os.symlink(links[name], op_prefix + name, target_is_directory=is_dir, dir_fd=op_dir_fd)
+                else:
+                    if verbose:
+                        logger.info('Removing %s', dst_prefix + name)
+                    removed.append(rel_prefix + name)
+                    if action == 'rmdir':
+                        shutil.rmtree(op_prefix + name, dir_fd=op_dir_fd)
+                    else:
+                        os.unlink(op_prefix + name, dir_fd=op_dir_fd)
+        finally:
+            if _USE_DIR_FD:
+                os.close(src_ref)
+                os.close(dst_ref)
+        return [rel_prefix + name for name in subdirs]
+
+    os.makedirs(dst_dir, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=workers) as copy_pool, \
+            ThreadPoolExecutor(max_workers=walk_workers) as walk_pool:
         try:
-            p = base / name
-            if _is_hidden(p):
-                logger.debug(f'Ignoring hidden item: {p}')
-                ignore.add(name)
-        except Exception as e:
-            logger.debug(f'Error checking {name}: {e}')
-            continue
-    return ignore
+            walking = {walk_pool.submit(sync_level, '')}
+            while walking:
+                done, walking = wait(walking, return_when=FIRST_COMPLETED)
+                for future in done:
+                    for rel_path in future.result():
+                        walking.add(walk_pool.submit(sync_level, rel_path))
+            # Every directory has been compared, so no more copies are queued
+            for future in as_completed(copies):
+                future.result()
+        except BaseException:
+            walk_pool.shutdown(wait=False, cancel_futures=True)
+            copy_pool.shutdown(wait=False, cancel_futures=True)
+            raise
+    if use_cache:
+        _save_cache(src_dir, dst_dir, exclude_hidden, current)
+    return len(copies), len(removed)
+
+def _native_sync_command(src, dst, exclude_hidden, verbose):
+    """
+    Return the command line of an external mirroring tool, or None.
+
+    Windows uses `robocopy /MIR`, other systems `rsync -a --delete`
+    (`--exclude=.*` with `--delete-excluded` drops hidden items, also from the
+    target). None is returned when the tool is not on PATH, and on Windows
+    when `exclude_hidden` is True: robocopy's `/XA:H` only applies to files,
+    and `/MIR` leaves excluded items in the target instead of purging them, so
+    that case is left to the Python sync. Unless `verbose` is True, robocopy
+    is told not to produce its per-file/per-directory listing and job
+    header/summary, and rsync runs without `-v`.
+    """
+    if os.name == 'nt':
+        if exclude_hidden:
+            return None
+        robocopy = shutil.which('robocopy')
+        if robocopy is None:
+            return None
+        cmd = [robocopy, src, dst, '/MIR']
+        if not verbose:
+            cmd += ['/NFL', '/NDL', '/NJH', '/NJS']
+        return cmd
+
+    rsync = shutil.which('rsync')
+    if rsync is None:
+        return None
+    cmd = [rsync, '-a', '--delete']
+    if exclude_hidden:
+        cmd += ['--exclude=.*', '--delete-excluded']
+    if verbose:
+        cmd.append('-v')
+    # Trailing separators make rsync copy the contents of src into dst
+    return cmd + [os.path.join(src, ''), os.path.join(dst, '')]
+
+def _sync_native(cmd, dst, verbose):
+    """
+    Run the mirroring command from `_native_sync_command`.
 
-def sync_dir(src: Path, dst: Path, exclude_hidden: bool = False, verbose: bool = True):
+    The tool's own output is shown only when `verbose` is True. robocopy
+    reports success with exit codes below 8, rsync with 0.
+
+    Raises:
+        subprocess.CalledProcessError: If the tool reports a failure.
+    """
+    os.makedirs(dst, exist_ok=True)
+    result = subprocess.run(cmd, stdout=None if verbose else subprocess.DEVNULL)
+    max_ok = 7 if os.name == 'nt' else 0
+    if result.returncode > max_ok:
+        raise subprocess.CalledProcessError(result.returncode, cmd)
+
+def sync_dir(src: Path, dst: Path, exclude_hidden: bool = False, verbose: bool = False):
     """
     Perform directory synchronization.
 
@@ -77,50 +517,47 @@ def sync_dir(src: Path, dst: Path, exclude_hidden: bool = False, verbose: bool =
     Files missing from the source will be removed from the target. The target
     directory will be created if it does not exist.
 
+    `robocopy` (Windows, without `exclude_hidden`) or `rsync` (elsewhere) is
+    used when found on PATH; otherwise both trees are compared in Python and
+    only changed files are copied.
+
     Args:
-        src (Path): Path to the source directory.
-        dst (Path): Path to the destination directory.
+        src (Path | str): Path to the source directory.
+        dst (Path | str): Path to the destination directory.
         exclude_hidden (bool): If True, exclude hidden files and directories. Default: False.
-        verbose (bool): Passed to `dirsync.sync` to control detailed output. Default: False.
+        verbose (bool): If True, show the tool's output or log copied and removed items at INFO. Default: False.
 
     Raises:
         FileNotFoundError: If the source directory does not exist.
+        subprocess.CalledProcessError: If robocopy/rsync reports a failure.
     """
-    src = src.resolve()
-    dst = dst.resolve()
+    # Resolve both paths to absolute strings once and pass those around. The
+    # source must exist and is canonicalized like Path.resolve(); the target
+    # often does not exist yet, so it is only normalized lexically (abspath
+    # needs no syscalls)
+    src = os.path.realpath(os.fspath(src))
+    dst = os.path.abspath(os.fspath(dst))
 
     logger.debug('Checking if source directory exists')
-    if not src.exists():
-        logger.error(f"Source directory does not exist: {src}")
-        raise FileNotFoundError(f"Source directory does not exist: {src}")
+    try:
+        os.stat(src)
+    except FileNotFoundError:
+        logger.error('Source directory does not exist: %s', src)
+        raise FileNotFoundError(f"Source directory does not exist: {src}") from None
 
-    logger.debug(f'Starting synchronization: {src} to {dst}')
-    if exclude_hidden:
-        # To exclude hidden items, copy the source to a temporary directory and sync from that copy
-        with tempfile.TemporaryDirectory() as tmpdir:
-            temp_src = Path(tmpdir) / src.name
-            logger.debug(f'Copying source to temporary dir (excluding hidden items): {temp_src}')
-            shutil.copytree(src, temp_src, ignore=_ignore_hidden)
-            logger.debug('Temporary copy completed; invoking dirsync.sync')
-            sync(
-                sourcedir=str(temp_src),
-                targetdir=str(dst),
-                action="sync",     # Incremental synchronization
-                verbose=verbose,     # Display execution details
-                purge=True,        # Delete files not in source directory
-                create=True        # Auto-create target directory
-            )
+    logger.debug('Starting synchronization: %s to %s', src, dst)
+    cmd = _native_sync_command(src, dst, exclude_hidden, verbose)
+    if cmd is not None:
+        # robocopy/rsync mirror the tree natively, much faster than a Python walk
+        logger.debug('Running %s', cmd[0])
+        _sync_native(cmd, dst, verbose)
+        logger.info('Synchronized %s to %s with %s', src, dst, cmd[0])
     else:
-        sync(
-            sourcedir=str(src),
-            targetdir=str(dst),
-            action="sync",     # Incremental synchronization
-            verbose=verbose,     # Display execution details
-            purge=True,        # Delete files not in source directory
-            create=True        # Auto-create target directory
-        )
+        # Compare both trees and copy only what changed
+        copied, removed = _sync_tree(src, dst, exclude_hidden, verbose)
+        logger.info('Synchronized %s to %s: %d file(s) copied, %d item(s) removed', src, dst, copied, removed)
 
-    logger.debug(f'Synchronization completed: {src} to {dst}')
+    logger.debug('Synchronization completed: %s to %s', src, dst)
 
 if __name__ == "__main__":
     """
@@ -133,7 +570,7 @@ if __name__ == "__main__":
     from myutilspkg import mylogger
     dir_path = os.path.dirname(os.path.abspath(__file__))
     file_name = os.path.basename(dir_path)
-    mylogger.init_logger(file_name, dir_path)
+    mylogger.init_logger(file_name, dir_path, level=logging.DEBUG)
     logger.debug('Direct execution detected')
     dir_src = os.path.dirname(os.path.abspath(__file__))
     dir_dst = Path.home() / 'mysyncdirdst'
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for myutilspkg.mylogger
+
+`init_logger` configures the root logger; each test restores it and stops
+the queue listeners it started. Run from the `packages` directory with
+`python -m unittest discover tests` (or `python -m pytest tests`).
+"""
+
+import atexit
+import io
+import logging
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from myutilspkg.mylogger import main as mylogger
+
+
+class _ListHandler(logging.Handler):
+    """Collect the records it handles."""
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+def _read(path):
+    with open(path, encoding='utf-8') as f:
+        return f.read()
+
+def _log_via_helper(logger, stacklevel):
+    logger.info('from helper', stacklevel=stacklevel)
+
+
+class TestCountingRotatingFileHandler(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp)
+        self.path = os.path.join(self.tmp, 'test.log')
+
+    def make_handler(self, **kwargs):
+        handler = mylogger.CountingRotatingFileHandler(
+            self.path, maxBytes=200, backupCount=3, encoding='utf-8', **kwargs,
+        )
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        self.addCleanup(handler.close)
+        return handler
+
+    def emit(self, handler, msg):
+        handler.handle(logging.makeLogRecord({'msg': msg, 'levelno': logging.INFO}))
+
+    def test_rollover_keeps_files_within_max_bytes(self):
+        handler = self.make_handler()
+        for i in range(40):
+            self.emit(handler, f'record {i:02d} ' + 'x' * 20)
+        handler.flush()
+        paths = [self.path] + [f'{self.path}.{n}' for n in range(1, 4)]
+        for path in paths:
+            self.assertTrue(os.path.exists(path), path)
+            self.assertLess(os.path.getsize(path), 200, path)
+        self.assertFalse(os.path.exists(f'{self.path}.4'))
+
+    def test_counter_matches_file_size(self):
+        handler = self.make_handler()
+        for i in range(5):
+            self.emit(handler, f'record {i}\nsecond line')
+        handler.flush()
+        self.assertEqual(handler._bytes, os.path.getsize(self.path))
+
+    def test_counter_starts_from_existing_file(self):
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write('x' * 150)
+        handler = self.make_handler()
+        self.assertEqual(handler._bytes, 150)
+        self.emit(handler, 'y' * 60)
+        handler.flush()
+        self.assertEqual(os.path.getsize(f'{self.path}.1'), 150)
+        self.assertEqual(handler._bytes, os.path.getsize(self.path))
+
+    def test_without_autoflush_records_stay_buffered(self):
+        handler = self.make_handler(autoflush=False)
+        self.emit(handler, 'buffered')
+        self.assertEqual(_read(self.path), '')
+        handler.handle(logging.makeLogRecord({'msg': 'warned', 'levelno': logging.WARNING}))
+        self.assertEqual(_read(self.path), 'buffered\nwarned\n')
+
+
+class TestFastFormatter(unittest.TestCase):
+
+    def test_line_layout(self):
+        record = logging.makeLogRecord({
+            'msg': 'hello %s', 'args': ('world',), 'levelname': 'INFO',
+            'name': 'pkg', 'funcName': 'func', 'created': 0.5, 'msecs': 500,
+        })
+        line = mylogger.FastFormatter().format(record)
+        self.assertTrue(line.endswith('.500, INFO, pkg, func, hello world'), line)
+
+    def test_datefmt_none_uses_default(self):
+        formatter = mylogger.FastFormatter(datefmt=None)
+        self.assertEqual(formatter.datefmt, mylogger.DEFAULT_DATEFMT)
+        formatter.format(logging.makeLogRecord({'msg': 'x'}))
+
+
+class TestMemoizingLogger(unittest.TestCase):
+
+    def setUp(self):
+        base = logging.Logger('test_memoizing', logging.DEBUG)
+        self.handler = _ListHandler()
+        base.addHandler(self.handler)
+        self.logger = mylogger.MemoizingLogger(base)
+
+    def test_caller_is_recorded(self):
+        self.logger.info('hello %s', 'there')
+        record = self.handler.records[0]
+        self.assertEqual(record.funcName, 'test_caller_is_recorded')
+        self.assertEqual(record.pathname, __file__)
+        self.assertEqual(record.getMessage(), 'hello there')
+
+    def test_stacklevel(self):
+        _log_via_helper(self.logger, 1)
+        _log_via_helper(self.logger, 2)
+        self.assertEqual([r.funcName for r in self.handler.records], ['_log_via_helper', 'test_stacklevel'])
+
+    def test_disabled_level_is_dropped(self):
+        self.logger.setLevel(logging.INFO)
+        self.logger.debug('hidden')
+        self.assertEqual(self.handler.records, [])
+
+    def test_exception_records_exc_info(self):
+        try:
+            raise ValueError('boom')
+        except ValueError:
+            self.logger.exception('failed')
+        record = self.handler.records[0]
+        self.assertEqual(record.levelno, logging.ERROR)
+        self.assertIs(record.exc_info[0], ValueError)
+
+    def test_exc_info_accepts_exception_instance(self):
+        error = KeyError('k')
+        self.logger.error('failed', exc_info=error)
+        self.assertIs(self.handler.records[0].exc_info[1], error)
+
+
+class TestInitLogger(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp)
+        root = logging.getLogger()
+        saved_handlers, saved_level = root.handlers[:], root.level
+        self.addCleanup(root.setLevel, saved_level)
+        self.addCleanup(setattr, root, 'handlers', saved_handlers)
+        self.stderr = io.StringIO()
+        patcher = mock.patch('sys.stderr', self.stderr)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.stop)
+
+    def init(self, name, level=logging.INFO):
+        logger = mylogger.init_logger(name, self.tmp, level=level)
+        for listener in self.listeners():
+            self.addCleanup(atexit.unregister, listener.stop)
+        return logger
+
+    def listeners(self):
+        return [h.listener for h in logging.getLogger().handlers if getattr(h, 'listener', None)]
+
+    def stop(self):
+        for listener in self.listeners():
+            if listener._thread is not None:
+                listener.stop()
+            for handler in listener.handlers:
+                if isinstance(handler, mylogger.CountingRotatingFileHandler):
+                    handler.close()
+
+    def log_path(self, name):
+        return os.path.join(mylogger.get_log_dir(self.tmp), f'{name}.log')
+
+    def test_records_on_disk_after_stop(self):
+        logger = self.init('stop')
+        logger.info('persisted')
+        self.stop()
+        self.assertIn('persisted', _read(self.log_path('stop')))
+        self.assertIn('persisted', self.stderr.getvalue())
+
+    def test_flushed_when_queue_drains(self):
+        logger = self.init('drain')
+        logger.info('drained')
+        deadline = time.monotonic() + 5
+        while 'drained' not in _read(self.log_path('drain')) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertIn('drained', _read(self.log_path('drain')))
+
+    def test_reinit_does_not_duplicate_output(self):
+        self.init('again')
+        logger = self.init('again')
+        self.assertEqual(len(self.listeners()), 1)
+        logger.info('once')
+        self.stop()
+        self.assertEqual(_read(self.log_path('again')).count('once'), 1)
+        self.assertEqual(self.stderr.getvalue().count('once'), 1)
+
+    def test_reinit_updates_levels(self):
+        self.init('first', level=logging.INFO)
+        logger = self.init('second', level=logging.DEBUG)
+        logger.debug('debug line')
+        self.stop()
+        self.assertIn('debug line', _read(self.log_path('second')))
+        self.assertEqual(self.stderr.getvalue().count('debug line'), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
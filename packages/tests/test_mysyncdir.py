@@ -0,0 +1,340 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for myutilspkg.mysyncdir
+
+The Python sync (`_sync_tree`) is exercised directly by disabling the
+robocopy/rsync fast path; the command lines and exit code handling of that
+path are tested with `shutil.which` and `subprocess.run` mocked. Run from the `packages` directory with
+`python -m unittest discover tests` (or `python -m pytest tests`).
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from myutilspkg.mysyncdir import main as mysyncdir
+
+OLD_MTIME = 1_600_000_000
+
+def _write(path, text='data'):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+def _read(path):
+    with open(path, encoding='utf-8') as f:
+        return f.read()
+
+def _tree(root):
+    """Return {relative path: file text, 'dir' or 'link -> target'} for a tree, without the cache file."""
+    result = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        for name in dirnames + filenames:
+            path = os.path.join(dirpath, name)
+            rel = os.path.relpath(path, root).replace(os.sep, '/')
+            if rel == mysyncdir.CACHE_FILE_NAME:
+                continue
+            if os.path.islink(path):
+                result[rel] = 'link -> ' + os.readlink(path)
+            elif os.path.isdir(path):
+                result[rel] = 'dir'
+            else:
+                result[rel] = _read(path)
+    return result
+
+def _age(root):
+    """Set an old mtime on every directory under `root` so their listings are cached."""
+    for dirpath, _, _ in os.walk(root):
+        os.utime(dirpath, (OLD_MTIME, OLD_MTIME))
+
+
+class SyncDirTestCase(unittest.TestCase):
+
+    def setUp(self):
+        # sync_dir canonicalizes the source, so compare against the real path
+        self.tmp = os.path.realpath(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp)
+        self.src = os.path.join(self.tmp, 'src')
+        self.dst = os.path.join(self.tmp, 'dst')
+        os.mkdir(self.src)
+        patcher = mock.patch.object(mysyncdir, '_native_sync_command', return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def sync(self, **kwargs):
+        mysyncdir.sync_dir(self.src, self.dst, **kwargs)
+
+    def load_cache(self):
+        with open(os.path.join(self.dst, mysyncdir.CACHE_FILE_NAME), encoding='utf-8') as f:
+            return json.load(f)
+
+
+class TestMirror(SyncDirTestCase):
+
+    def test_creates_target_and_copies_tree(self):
+        _write(os.path.join(self.src, 'a.txt'), 'a')
+        _write(os.path.join(self.src, 'sub', 'deep', 'b.txt'), 'b')
+        self.sync()
+        self.assertEqual(_tree(self.dst), _tree(self.src))
+
+    def test_mirror_after_changes(self):
+        _write(os.path.join(self.src, 'keep.txt'), 'keep')
+        _write(os.path.join(self.src, 'change.txt'), 'old')
+        _write(os.path.join(self.src, 'gone', 'x.txt'), 'x')
+        self.sync()
+        _write(os.path.join(self.src, 'change.txt'), 'new contents')
+        shutil.rmtree(os.path.join(self.src, 'gone'))
+        _write(os.path.join(self.src, 'added', 'y.txt'), 'y')
+        _write(os.path.join(self.dst, 'stray.txt'), 'stray')
+        self.sync()
+        self.assertEqual(_tree(self.dst), _tree(self.src))
+
+    def test_missing_source_raises(self):
+        with self.assertRaises(FileNotFoundError), self.assertLogs(mysyncdir.logger, 'ERROR'):
+            mysyncdir.sync_dir(os.path.join(self.tmp, 'missing'), self.dst)
+
+
+class TestHidden(SyncDirTestCase):
+
+    def setUp(self):
+        super().setUp()
+        _write(os.path.join(self.src, 'visible.txt'))
+        _write(os.path.join(self.src, '.hidden.txt'))
+        _write(os.path.join(self.src, '.hdir', 'inner.txt'))
+
+    def test_exclude_hidden_skips_and_purges(self):
+        _write(os.path.join(self.dst, '.stale', 'old.txt'))
+        self.sync(exclude_hidden=True)
+        self.assertEqual(_tree(self.dst), {'visible.txt': 'data'})
+
+    def test_hidden_items_copied_by_default(self):
+        self.sync()
+        self.assertEqual(_tree(self.dst), _tree(self.src))
+
+
+class TestTypeChanges(SyncDirTestCase):
+
+    def test_file_replaced_by_directory(self):
+        _write(os.path.join(self.src, 'item'))
+        self.sync()
+        os.remove(os.path.join(self.src, 'item'))
+        _write(os.path.join(self.src, 'item', 'inner.txt'), 'inner')
+        self.sync()
+        self.assertEqual(_tree(self.dst), _tree(self.src))
+
+    def test_directory_replaced_by_file(self):
+        _write(os.path.join(self.src, 'item', 'inner.txt'))
+        self.sync()
+        shutil.rmtree(os.path.join(self.src, 'item'))
+        _write(os.path.join(self.src, 'item'), 'now a file')
+        self.sync()
+        self.assertEqual(_tree(self.dst), _tree(self.src))
+
+
+class TestCache(SyncDirTestCase):
+
+    def test_listings_of_old_directories_are_cached(self):
+        _write(os.path.join(self.src, 'sub', 'a.txt'))
+        _age(self.src)
+        self.sync()
+        self.assertEqual(sorted(self.load_cache()['dirs']), ['', 'sub'])
+
+    def test_unchanged_mtime_reuses_listing(self):
+        sub = os.path.join(self.src, 'sub')
+        _write(os.path.join(sub, 'a.txt'))
+        _age(self.src)
+        self.sync()
+        # A new name behind an unchanged mtime is not seen: the cached listing is used
+        _write(os.path.join(sub, 'b.txt'))
+        os.utime(sub, (OLD_MTIME, OLD_MTIME))
+        self.sync()
+        self.assertFalse(os.path.exists(os.path.join(self.dst, 'sub', 'b.txt')))
+
+    def test_changed_mtime_invalidates_listing(self):
+        sub = os.path.join(self.src, 'sub')
+        _write(os.path.join(sub, 'a.txt'))
+        _age(self.src)
+        self.sync()
+        _write(os.path.join(sub, 'b.txt'))
+        self.sync()
+        self.assertEqual(_tree(self.dst), _tree(self.src))
+
+    def test_changed_file_in_cached_directory_is_copied(self):
+        _write(os.path.join(self.src, 'a.txt'), 'old')
+        _age(self.src)
+        self.sync()
+        _write(os.path.join(self.src, 'a.txt'), 'changed')
+        os.utime(self.src, (OLD_MTIME, OLD_MTIME))
+        self.sync()
+        self.assertEqual(_read(os.path.join(self.dst, 'a.txt')), 'changed')
+
+    def test_racy_listing_is_not_cached(self):
+        sub = os.path.join(self.src, 'sub')
+        _write(os.path.join(sub, 'a.txt'))
+        mtime_ns = os.stat(sub).st_mtime_ns
+        self.sync()
+        self.assertNotIn('sub', self.load_cache()['dirs'])
+        # Added within the same timestamp tick: the mtime does not change
+        _write(os.path.join(sub, 'b.txt'))
+        os.utime(sub, ns=(mtime_ns, mtime_ns))
+        self.sync()
+        self.assertTrue(os.path.exists(os.path.join(self.dst, 'sub', 'b.txt')))
+
+    def test_cache_for_other_settings_is_ignored(self):
+        _write(os.path.join(self.src, 'a.txt'))
+        _age(self.src)
+        self.sync()
+        self.assertEqual(mysyncdir._load_cache(self.src + 'x', self.dst, False), {})
+        self.assertEqual(mysyncdir._load_cache(self.src, self.dst, True), {})
+        self.assertNotEqual(mysyncdir._load_cache(self.src, self.dst, False), {})
+
+
+@unittest.skipIf(os.name == 'nt', 'creating symlinks needs extra privileges on Windows')
+class TestSymlinks(SyncDirTestCase):
+
+    def test_target_symlink_is_not_followed(self):
+        outside = os.path.join(self.tmp, 'outside')
+        os.mkdir(outside)
+        _write(os.path.join(self.src, 'a', 'f'), 'f')
+        os.mkdir(self.dst)
+        os.symlink(outside, os.path.join(self.dst, 'a'))
+        self.sync()
+        self.assertEqual(os.listdir(outside), [])
+        self.assertEqual(_tree(self.dst), _tree(self.src))
+
+    def test_target_file_symlink_is_not_written_through(self):
+        outside = os.path.join(self.tmp, 'outside.txt')
+        _write(outside, 'outside')
+        _write(os.path.join(self.src, 'f'), 'source')
+        os.mkdir(self.dst)
+        os.symlink(outside, os.path.join(self.dst, 'f'))
+        self.sync()
+        self.assertEqual(_read(outside), 'outside')
+        self.assertEqual(_tree(self.dst), _tree(self.src))
+
+    def test_source_symlinks_are_copied_as_links(self):
+        _write(os.path.join(self.src, 'a', 'f'))
+        os.symlink('nowhere', os.path.join(self.src, 'broken'))
+        os.symlink('..', os.path.join(self.src, 'a', 'loop'))
+        os.symlink('f', os.path.join(self.src, 'a', 'lf'))
+        self.sync()
+        self.assertEqual(_tree(self.dst), _tree(self.src))
+        self.assertEqual(os.readlink(os.path.join(self.dst, 'broken')), 'nowhere')
+
+    def test_changed_link_is_replaced(self):
+        os.symlink('one', os.path.join(self.src, 'link'))
+        self.sync()
+        os.remove(os.path.join(self.src, 'link'))
+        os.symlink('two', os.path.join(self.src, 'link'))
+        self.sync()
+        self.assertEqual(os.readlink(os.path.join(self.dst, 'link')), 'two')
+
+
+@unittest.skipUnless(hasattr(os, 'mkfifo'), 'requires os.mkfifo')
+class TestSpecialFiles(SyncDirTestCase):
+
+    def test_fifo_is_skipped(self):
+        _write(os.path.join(self.src, 'a.txt'))
+        os.mkfifo(os.path.join(self.src, 'fifo'))
+        with self.assertLogs(mysyncdir.logger, 'WARNING'):
+            self.sync()
+        self.assertEqual(_tree(self.dst), {'a.txt': 'data'})
+
+    def test_copy_file_rejects_fifo(self):
+        fifo = os.path.join(self.tmp, 'fifo')
+        os.mkfifo(fifo)
+        with self.assertRaises(shutil.SpecialFileError):
+            mysyncdir._copy_file(fifo, os.path.join(self.tmp, 'out'))
+
+
+@unittest.skipUnless(mysyncdir._USE_COPY_FILE_RANGE, 'requires os.copy_file_range')
+class TestCopyFileRange(SyncDirTestCase):
+
+    def test_falls_back_when_nothing_is_copied(self):
+        source = os.path.join(self.tmp, 'in.txt')
+        target = os.path.join(self.tmp, 'out.txt')
+        _write(source, 'contents')
+        with mock.patch.object(mysyncdir.os, 'copy_file_range', return_value=0):
+            mysyncdir._copy_file(source, target)
+        self.assertEqual(_read(target), 'contents')
+
+
+
+class TestNativeSyncCommand(unittest.TestCase):
+
+    def command(self, os_name, tool, **kwargs):
+        kwargs.setdefault('exclude_hidden', False)
+        kwargs.setdefault('verbose', False)
+        with mock.patch.object(mysyncdir.os, 'name', os_name), \
+                mock.patch.object(mysyncdir.shutil, 'which', return_value=tool):
+            return mysyncdir._native_sync_command('src', 'dst', **kwargs)
+
+    def test_rsync(self):
+        cmd = self.command('posix', '/usr/bin/rsync')
+        self.assertEqual(cmd, ['/usr/bin/rsync', '-a', '--delete', os.path.join('src', ''), os.path.join('dst', '')])
+
+    def test_rsync_exclude_hidden(self):
+        cmd = self.command('posix', '/usr/bin/rsync', exclude_hidden=True)
+        self.assertEqual(cmd[1:5], ['-a', '--delete', '--exclude=.*', '--delete-excluded'])
+
+    def test_rsync_verbose(self):
+        self.assertIn('-v', self.command('posix', '/usr/bin/rsync', verbose=True))
+        self.assertNotIn('-v', self.command('posix', '/usr/bin/rsync'))
+
+    def test_robocopy_quiet_by_default(self):
+        cmd = self.command('nt', 'robocopy')
+        self.assertEqual(cmd, ['robocopy', 'src', 'dst', '/MIR', '/NFL', '/NDL', '/NJH', '/NJS'])
+
+    def test_robocopy_verbose(self):
+        self.assertEqual(self.command('nt', 'robocopy', verbose=True), ['robocopy', 'src', 'dst', '/MIR'])
+
+    def test_robocopy_not_used_with_exclude_hidden(self):
+        self.assertIsNone(self.command('nt', 'robocopy', exclude_hidden=True))
+
+    def test_tool_not_on_path(self):
+        self.assertIsNone(self.command('posix', None))
+        self.assertIsNone(self.command('nt', None))
+
+
+class TestSyncNative(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp)
+        self.dst = os.path.join(self.tmp, 'dst')
+
+    def run_tool(self, os_name, returncode, verbose=False):
+        cmd = ['tool', 'src', self.dst]
+        result = mysyncdir.subprocess.CompletedProcess(cmd, returncode)
+        with mock.patch.object(mysyncdir.os, 'name', os_name), \
+                mock.patch.object(mysyncdir.subprocess, 'run', return_value=result) as run:
+            mysyncdir._sync_native(cmd, self.dst, verbose)
+        return run
+
+    def test_robocopy_success_codes(self):
+        for returncode in range(8):
+            self.run_tool('nt', returncode)
+
+    def test_robocopy_failure_codes(self):
+        for returncode in (8, 16):
+            with self.assertRaises(mysyncdir.subprocess.CalledProcessError):
+                self.run_tool('nt', returncode)
+
+    def test_rsync_must_return_zero(self):
+        self.run_tool('posix', 0)
+        with self.assertRaises(mysyncdir.subprocess.CalledProcessError):
+            self.run_tool('posix', 1)
+
+    def test_creates_target_and_hides_output(self):
+        run = self.run_tool('posix', 0)
+        self.assertTrue(os.path.isdir(self.dst))
+        self.assertEqual(run.call_args.kwargs['stdout'], mysyncdir.subprocess.DEVNULL)
+        run = self.run_tool('posix', 0, verbose=True)
+        self.assertIsNone(run.call_args.kwargs['stdout'])
+
+
+if __name__ == '__main__':
+    unittest.main()